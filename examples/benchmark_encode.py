@@ -0,0 +1,30 @@
+import time
+from typing import Optional
+
+import ndef
+
+
+COUNT = 100000
+
+payloads = [('\x02enmessage %d' % i).encode('utf-8') for i in range(COUNT)]
+tnfs = [ndef.TNF_WELL_KNOWN] * COUNT
+types = [ndef.RTD_TEXT] * COUNT
+ids = [b''] * COUNT
+boundaries = list(range(COUNT + 1))
+
+
+def measure(name: str, verify: Optional[bool]) -> None:
+    start = time.perf_counter()
+    if verify is None:
+        buffers = [ndef.new_message((ndef.TNF_WELL_KNOWN, ndef.RTD_TEXT, b'', p)).to_buffer() for p in payloads]
+        size = sum(len(b) for b in buffers)
+    else:
+        buffer, _ = ndef.encode_many(tnfs, types, ids, payloads, boundaries, verify=verify)
+        size = len(buffer)
+    elapsed = time.perf_counter() - start
+    print('%-28s %.2fs for %d messages, %d bytes' % (name, elapsed, COUNT, size))
+
+
+measure('new_message(...).to_buffer()', None)
+measure('encode_many(verify=True)', True)
+measure('encode_many(verify=False)', False)
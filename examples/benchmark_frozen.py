@@ -0,0 +1,64 @@
+import copy
+import threading
+import time
+import tracemalloc
+from typing import Callable, List
+
+import ndef
+
+
+MESSAGE_DATA = bytes.fromhex('99010501556101234567614901050000000155610123456761')
+COUNT = 2000
+THREADS = 8
+
+mutable_messages = [ndef.NdefMessage(MESSAGE_DATA) for _ in range(COUNT)]
+frozen_messages = [ndef.FrozenNdefMessage(MESSAGE_DATA) for _ in range(COUNT)]
+
+
+def copied_worker(kept: List[object]) -> None:
+    # mutable messages are copied before being handed to a thread, and can't be hashed for dedup
+    seen = set()
+    for message in mutable_messages:
+        local = copy.deepcopy(message)
+        kept.append(local)
+        seen.add(local.to_buffer())
+
+
+def shared_worker(kept: List[object]) -> None:
+    seen = set()
+    for message in frozen_messages:
+        kept.append(message)
+        seen.add(message)
+
+
+def run(worker: Callable[[List[object]], None]) -> List[List[object]]:
+    kept: List[List[object]] = [[] for _ in range(THREADS)]
+    threads = [threading.Thread(target=worker, args=(k,)) for k in kept]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return kept
+
+
+def measure(name: str, worker: Callable[[List[object]], None]) -> None:
+    start = time.perf_counter()
+    run(worker)
+    elapsed = time.perf_counter() - start
+
+    # messages handed to the threads are kept alive, so every copy shows up as allocated blocks
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = run(worker)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocations = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    del kept
+
+    print('%s:' % name)
+    print('  time for %d messages on %d threads: %.3fs' % (COUNT, THREADS, elapsed))
+    print('  allocated blocks per message:      %.1f' % (allocations / (COUNT * THREADS)))
+
+
+measure('deepcopy(NdefMessage) per thread', copied_worker)
+measure('shared FrozenNdefMessage', shared_worker)
@@ -0,0 +1,71 @@
+import gc
+import time
+import tracemalloc
+from typing import Callable, List, Optional, Sequence
+
+import ndef
+
+
+MESSAGE_DATA = bytes.fromhex('99010501556101234567614901050000000155610123456761')
+COUNT = 100000
+ALLOCATION_COUNT = 10000
+
+
+def retain(kept: List[object], records: Sequence[ndef.NdefRecord]) -> None:
+    kept.append([(r, r.flags, r.type, r.id, r.payload) for r in records])
+
+
+def parse_message(kept: Optional[List[object]], count: int) -> None:
+    for _ in range(count):
+        message = ndef.NdefMessage(MESSAGE_DATA)
+        if kept is not None:
+            retain(kept, message.records)
+
+
+def parse_parser(kept: Optional[List[object]], count: int) -> None:
+    parser = ndef.NdefParser()
+    for _ in range(count):
+        parser.reset(MESSAGE_DATA)
+        if kept is not None:
+            retain(kept, parser.records)
+
+
+def baseline(kept: Optional[List[object]], count: int) -> None:
+    # keeps the same shape as the other two without parsing anything new
+    records = ndef.NdefMessage(MESSAGE_DATA).records
+    for _ in range(count):
+        if kept is not None:
+            retain(kept, records)
+
+
+def count_blocks(func: Callable[[Optional[List[object]], int], None]) -> int:
+    # everything reachable from the parsed records is kept alive, so each new object is one allocated block.
+    # objects freed before the parse returns, like NdefMessage's BufferReader, aren't counted.
+    kept: List[object] = []
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    func(kept, ALLOCATION_COUNT)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+
+
+def measure(name: str, func: Callable[[Optional[List[object]], int], None]) -> None:
+    gc.collect()
+    collections_before = sum(s['collections'] for s in gc.get_stats())
+    start = time.perf_counter()
+    func(None, COUNT)
+    elapsed = time.perf_counter() - start
+    collections = sum(s['collections'] for s in gc.get_stats()) - collections_before
+
+    allocations = count_blocks(func) - count_blocks(baseline)
+
+    scale = 1000000 / COUNT
+    print('%s:' % name)
+    print('  time per million messages:        %.2fs' % (elapsed * scale))
+    print('  gc collections per million:       %d' % (collections * scale))
+    print('  allocated blocks per million:     %d' % (allocations * 1000000 / ALLOCATION_COUNT))
+
+
+measure('NdefMessage(data)', parse_message)
+measure('NdefParser.reset(data)', parse_parser)
@@ -1,4 +1,5 @@
-from .ndef import NdefMessage, NdefRecord, new_message, new_smart_poster
+from .ndef import NdefMessage, NdefParser, NdefRecord, encode_many, new_message, new_smart_poster
+from .ndef import FrozenNdefMessage, FrozenNdefRecord, FrozenNdefRecordFlags
 from .ndef import TNF_EMPTY, TNF_EXTERNAL, TNF_MEDIA, TNF_RESERVED, TNF_UNCHANGED, TNF_UNKNOWN, TNF_URI, TNF_WELL_KNOWN
 from .ndef import RTD_SMART_POSTER, RTD_TEXT, RTD_URI, RTD_URI_ABBRIV_NUM
 from .ndef import InvalidNdef, InvalidNdefMessage, InvalidNdefRecord
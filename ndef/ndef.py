@@ -3,10 +3,12 @@
 #   line 87 - phFriNfc_NdefRecord_GetRecords()
 from __future__ import annotations
 
+import array
 import enum
 import functools
+import itertools
 import struct
-from typing import Callable, Iterable, Collection, Sequence
+from typing import Callable, Iterable, Collection, NamedTuple, Sequence
 
 
 class InvalidNdef(Exception):
@@ -50,24 +52,33 @@ SIZE2STRUCT = {
 }
 
 
-class BufferReader(object):
-    read_8: Callable[[], int]
-    read_16: Callable[[], int]
-    read_32: Callable[[], int]
+SIZE2PACKER = {size: struct.Struct(fmt) for size, fmt in SIZE2STRUCT.items()}
+
 
+class BufferReader(object):
     def __init__(self, buffer: bytes) -> None:
         self.buffer: bytes = buffer
         self.offset: int = 0
 
-        for size in SIZE2STRUCT:
-            setattr(self, 'read_%d' % size, functools.partial(self._read, size))
+    def reset(self, buffer: bytes) -> None:
+        self.buffer = buffer
+        self.offset = 0
+
+    def read_8(self) -> int:
+        return self._read(8)
+
+    def read_16(self) -> int:
+        return self._read(16)
+
+    def read_32(self) -> int:
+        return self._read(32)
 
     def _read(self, size: int) -> int:
         try:
-            res: tuple[int,] = struct.unpack_from(SIZE2STRUCT[size], self.buffer, self.offset)  # type: ignore
+            res: tuple[int,] = SIZE2PACKER[size].unpack_from(self.buffer, self.offset)  # type: ignore
         except struct.error:
             raise InvalidNdef('not enough bytes')
-        self.offset += int(size / 8)
+        self.offset += size // 8
         return res[0]
 
     def read(self, size: int) -> bytes:
@@ -131,101 +142,25 @@ class NdefRecord(object):
         if reader is None:
             return
 
-        flags_raw = reader.read_8()
-        if flags_raw & FLAGS_MB:
-            self.flags.message_begin = True
-        if flags_raw & FLAGS_ME:
-            self.flags.message_end = True
-        if flags_raw & FLAGS_CHUNKED:
-            self.flags.chunked = True
-        if flags_raw & FLAGS_SHORT:
-            self.flags.short = True
-        if flags_raw & FLAGS_ID:
-            self.flags.id = True
-
-        self.tnf = flags_raw & FLAGS_TNF_MASK
-
-        self.type_len = reader.read_8()
-
-        if self.flags.short:
-            self.payload_len = reader.read_8()
-        else:
-            self.payload_len = reader.read_32()
-
-        if self.flags.id:
-            self.id_len = reader.read_8()
-        else:
-            self.id_len = 0
-
-        self.type = reader.read(self.type_len)
-
-        if self.flags.id:
-            self.id = reader.read(self.id_len)
-        else:
-            self.id = b''
-
-        self.payload = reader.read(self.payload_len)
-
+        self._parse(reader)
         self.verify()
 
-    def verify(self) -> None:
-        if self.tnf == TNF_EMPTY:
-            if self.type_len or self.id_len or self.payload_len:
-                raise InvalidNdefRecord("TNF is set to 'empty' but record not empty")
-
-        if self.tnf == TNF_UNKNOWN:
-            if self.type_len:
-                raise InvalidNdefRecord("TNF is set to 'unknown' but type not empty")
-
-        if self.tnf == TNF_UNCHANGED:
-            if self.type_len:
-                raise InvalidNdefRecord("TNF is set to 'unchanged' but type not empty")
-            if self.flags.id:
-                raise InvalidNdefRecord("TNF is set to 'unchanged' but id flag is on")
-
-        if self.tnf == TNF_RESERVED:
-            raise InvalidNdefRecord("TNF is set to 'reserved' (0x07)")
+    def _parse(self, reader: BufferReader) -> None:
+        # assigns every field, so NdefParser can reuse records
+        flags_raw, self.type, self.id, self.payload = _read_record(reader)
+        self.flags.message_begin = bool(flags_raw & FLAGS_MB)
+        self.flags.message_end = bool(flags_raw & FLAGS_ME)
+        self.flags.chunked = bool(flags_raw & FLAGS_CHUNKED)
+        self.flags.short = bool(flags_raw & FLAGS_SHORT)
+        self.flags.id = bool(flags_raw & FLAGS_ID)
 
-        if self.tnf == TNF_WELL_KNOWN:
-            if self.type == RTD_TEXT:
-                if len(self.payload) == 0:
-                    raise InvalidNdefRecord('RTD_TEXT payload missing status byte')
-
-                encoding = 'utf-8'
-                if self.payload[0] & 0x80:
-                    encoding = 'utf-16'
-
-                language_len = self.payload[0] & 0x1f
-                if self.payload_len < 1 + language_len:
-                    raise InvalidNdefRecord('RTD_TEXT contains invalid language code length')
-
-                try:
-                    self.payload[1:1 + language_len].decode('us-ascii')
-                except UnicodeDecodeError:
-                    raise InvalidNdefRecord('RTD_TEXT contains language code with invalid encoding')
-
-                try:
-                    self.payload[language_len + 1:].decode(encoding)
-                except UnicodeDecodeError:
-                    raise InvalidNdefRecord('RTD_TEXT payload failed to decode as ' + encoding)
-
-            elif self.type == RTD_URI:
-                if len(self.payload) == 0:
-                    raise InvalidNdefRecord('RTD_URI payload missing status byte')
-
-                if self.payload[0] > RTD_URI_ABBRIV_NUM:
-                    raise InvalidNdefRecord('RTD_URI payload starts with an invalid URI identifier code')
-
-                try:
-                    self.payload[1:].decode('utf-8')
-                except UnicodeDecodeError:
-                    raise InvalidNdefRecord('RTD_URI payload failed to decode as utf-8')
-
-            elif self.type == RTD_SMART_POSTER:
-                # parse internal message to verify it contains no errors
-                NdefMessage(self.payload)
+        self.tnf = flags_raw & FLAGS_TNF_MASK
+        self.type_len = len(self.type)
+        self.id_len = len(self.id)
+        self.payload_len = len(self.payload)
 
-                # TODO verify all other well known types
+    def verify(self) -> None:
+        _verify_record(self)
 
     def set_type(self, new_type: bytes) -> None:
         self.type = new_type
@@ -242,34 +177,7 @@ class NdefRecord(object):
         self.flags.short = self.payload_len < 256
 
     def to_buffer(self) -> bytes:
-        w = BufferWriter()
-        w.write_8(self._raw_flags() | self.tnf)
-        w.write_8(self.type_len)
-        if self.flags.short:
-            w.write_8(self.payload_len)
-        else:
-            w.write_32(self.payload_len)
-        if self.flags.id:
-            w.write_8(self.id_len)
-        w.write_bytes(self.type)
-        if self.flags.id:
-            w.write_bytes(self.id)
-        w.write_bytes(self.payload)
-        return w.get()
-
-    def _raw_flags(self) -> int:
-        raw = 0
-        if self.flags.chunked:
-            raw |= FLAGS_CHUNKED
-        if self.flags.id:
-            raw |= FLAGS_ID
-        if self.flags.message_begin:
-            raw |= FLAGS_MB
-        if self.flags.message_end:
-            raw |= FLAGS_ME
-        if self.flags.short:
-            raw |= FLAGS_SHORT
-        return raw
+        return _record_to_buffer(self)
 
 
 class NdefMessage(object):
@@ -288,48 +196,434 @@ class NdefMessage(object):
         self.verify()
 
     def verify(self) -> None:
-        self._verify_records()
-        self._verify_begin_end()
-        self._verify_chunks()
-        self._verify_android_specific()
+        _verify_message(self.records)
 
     def to_buffer(self) -> bytes:
         return b''.join(r.to_buffer() for r in self.records)
 
-    def _verify_records(self) -> None:
-        for r in self.records:
-            r.verify()
-
-    def _verify_begin_end(self) -> None:
-        if not self.records[0].flags.message_begin:
-            raise InvalidNdefMessage("first record's MB flag is off")
-        for r in self.records[1:]:
-            if r.flags.message_begin:
-                raise InvalidNdefMessage("MB flag is on for non-first record")
-        if not self.records[-1].flags.message_end:
-            raise InvalidNdefMessage("last record's ME flag is off")
-        for r in self.records[:-1]:
-            if r.flags.message_end:
-                raise InvalidNdefMessage("ME flag is on for non-last record")
-
-    def _verify_chunks(self) -> None:
-        chunked = False
-        for r in self.records:
-            if chunked:
-                if r.tnf != TNF_UNCHANGED:
-                    raise InvalidNdefMessage("record chunk type is not 'unchanged'")
-            elif r.tnf == TNF_UNCHANGED:
-                raise InvalidNdefMessage("non-chunked record type is 'unchanged'")
-
-            chunked = r.flags.chunked
-
-        if self.records[-1].flags.chunked:
-            raise InvalidNdefMessage("last record still chunked")
-
-    def _verify_android_specific(self) -> None:
-        if self.records[0].tnf != TNF_UNKNOWN and self.records[0].tnf != TNF_EMPTY:
-            if not self.records[0].type_len:
-                raise InvalidNdefMessage("first record has no type, but is also not empty or unknown")
+
+class NdefParser(object):
+    def __init__(self, data: bytes | None = None) -> None:
+        self.reader: BufferReader = BufferReader(b'')
+        self.records: list[NdefRecord] = []
+        self._pool: list[NdefRecord] = []
+
+        if data is not None:
+            self.reset(data)
+
+    def reset(self, data: bytes) -> NdefParser:
+        # records are only valid until the next reset(), use detach() to keep them
+        reader = self.reader
+        reader.reset(data)
+        records = self.records
+        records.clear()
+        pool = self._pool
+
+        try:
+            while not reader.eob():
+                if len(records) == len(pool):
+                    pool.append(NdefRecord())
+                record = pool[len(records)]
+                record._parse(reader)
+                records.append(record)
+            if not records:
+                raise InvalidNdef("empty NDEF message")
+
+            _verify_message(records)
+        except InvalidNdef:
+            records.clear()
+            raise
+
+        return self
+
+    def detach(self) -> NdefMessage:
+        message = NdefMessage()
+        message.records = self.records
+        del self._pool[:len(self.records)]
+        self.records = []
+        return message
+
+
+class FrozenNdefRecordFlags(NamedTuple):
+    message_begin: bool = False
+    message_end: bool = False
+    chunked: bool = False
+    short: bool = False
+    id: bool = False
+
+    @classmethod
+    def from_raw(cls, flags_raw: int) -> FrozenNdefRecordFlags:
+        return cls(bool(flags_raw & FLAGS_MB), bool(flags_raw & FLAGS_ME), bool(flags_raw & FLAGS_CHUNKED),
+                   bool(flags_raw & FLAGS_SHORT), bool(flags_raw & FLAGS_ID))
+
+
+# one shared instance per possible flags byte, so parsing never allocates flags
+_FROZEN_FLAGS = tuple(FrozenNdefRecordFlags.from_raw(i) for i in range(0x100))
+
+
+class FrozenNdefRecord(object):
+    # immutable, so instances can be shared between threads and used as dict keys without copying
+    __slots__ = ('flags', 'tnf', 'type', 'id', 'payload', '_hash')
+
+    flags: FrozenNdefRecordFlags
+    tnf: int
+    type: bytes
+    id: bytes
+    payload: bytes
+    _hash: int | None
+
+    def __init__(self, tnf: int = TNF_EMPTY, type: bytes = b'', id: bytes = b'', payload: bytes = b'',
+                 flags: FrozenNdefRecordFlags | None = None) -> None:
+        if flags is None:
+            flags = FrozenNdefRecordFlags(id=len(id) > 0, short=len(payload) < 256)
+        object.__setattr__(self, 'flags', flags)
+        object.__setattr__(self, 'tnf', tnf)
+        object.__setattr__(self, 'type', bytes(type))
+        object.__setattr__(self, 'id', bytes(id))
+        object.__setattr__(self, 'payload', bytes(payload))
+        object.__setattr__(self, '_hash', None)
+
+    @classmethod
+    def from_record(cls, record: NdefRecord) -> FrozenNdefRecord:
+        f = record.flags
+        flags = FrozenNdefRecordFlags(f.message_begin, f.message_end, f.chunked, f.short, f.id)
+        return cls(record.tnf, record.type, record.id, record.payload, flags)
+
+    @property
+    def type_len(self) -> int:
+        return len(self.type)
+
+    @property
+    def id_len(self) -> int:
+        return len(self.id)
+
+    @property
+    def payload_len(self) -> int:
+        return len(self.payload)
+
+    def verify(self) -> None:
+        _verify_record(self)
+
+    def evolve(self, tnf: int | None = None, type: bytes | None = None, id: bytes | None = None,
+               payload: bytes | None = None, flags: FrozenNdefRecordFlags | None = None) -> FrozenNdefRecord:
+        # like set_id() and set_payload(), a new id or payload updates the flags unless they're given explicitly
+        new_flags = self.flags if flags is None else flags
+        if flags is None and id is not None:
+            new_flags = new_flags._replace(id=len(id) > 0)
+        if flags is None and payload is not None:
+            new_flags = new_flags._replace(short=len(payload) < 256)
+        return FrozenNdefRecord(
+            self.tnf if tnf is None else tnf,
+            self.type if type is None else type,
+            self.id if id is None else id,
+            self.payload if payload is None else payload,
+            new_flags,
+        )
+
+    def thaw(self) -> NdefRecord:
+        record = NdefRecord()
+        record.flags.message_begin = self.flags.message_begin
+        record.flags.message_end = self.flags.message_end
+        record.flags.chunked = self.flags.chunked
+        record.flags.short = self.flags.short
+        record.flags.id = self.flags.id
+        record.tnf = self.tnf
+        record.type = self.type
+        record.type_len = self.type_len
+        record.id = self.id
+        record.id_len = self.id_len
+        record.payload = self.payload
+        record.payload_len = self.payload_len
+        return record
+
+    def to_buffer(self) -> bytes:
+        return _record_to_buffer(self)
+
+    def _key(self) -> tuple[FrozenNdefRecordFlags, int, bytes, bytes, bytes]:
+        return self.flags, self.tnf, self.type, self.id, self.payload
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, FrozenNdefRecord):
+            return NotImplemented
+        return hash(self) == hash(other) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        # computed lazily; racing threads store the same value, so no lock is needed
+        h = self._hash
+        if h is None:
+            h = hash(self._key())
+            object.__setattr__(self, '_hash', h)
+        return h
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError('FrozenNdefRecord is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('FrozenNdefRecord is immutable')
+
+    def __reduce__(self) -> tuple[Callable[..., object], tuple[int, bytes, bytes, bytes, FrozenNdefRecordFlags]]:
+        return FrozenNdefRecord, (self.tnf, self.type, self.id, self.payload, self.flags)
+
+    def __repr__(self) -> str:
+        return 'FrozenNdefRecord(tnf=%r, type=%r, id=%r, payload=%r, flags=%r)' % (
+            self.tnf, self.type, self.id, self.payload, self.flags)
+
+
+class FrozenNdefMessage(object):
+    __slots__ = ('records', '_hash')
+
+    records: tuple[FrozenNdefRecord, ...]
+    _hash: int | None
+
+    def __init__(self, data: bytes | None = None, records: Iterable[FrozenNdefRecord] | None = None) -> None:
+        # records get their MB/ME flags set, and those that already have the right ones are reused as-is
+        if data is not None and records is not None:
+            raise TypeError('FrozenNdefMessage() takes either data or records, not both')
+
+        if data is not None:
+            records = _read_frozen_records(BufferReader(data))
+        elif records is not None:
+            records = _with_begin_end(records)
+        else:
+            records = ()
+        object.__setattr__(self, 'records', tuple(records))
+        object.__setattr__(self, '_hash', None)
+
+        if data is not None:
+            if not self.records:
+                raise InvalidNdef("empty NDEF message")
+            self.verify()
+
+    @classmethod
+    def from_message(cls, message: NdefMessage) -> FrozenNdefMessage:
+        return cls._from_records([FrozenNdefRecord.from_record(r) for r in message.records])
+
+    @classmethod
+    def _from_records(cls, records: Iterable[FrozenNdefRecord]) -> FrozenNdefMessage:
+        # keeps the records' flags as they are
+        message = cls()
+        object.__setattr__(message, 'records', tuple(records))
+        return message
+
+    def verify(self) -> None:
+        _verify_message(self.records)
+
+    def evolve(self, records: Iterable[FrozenNdefRecord]) -> FrozenNdefMessage:
+        return FrozenNdefMessage(records=records)
+
+    def thaw(self) -> NdefMessage:
+        message = NdefMessage()
+        message.records = [r.thaw() for r in self.records]
+        return message
+
+    def to_buffer(self) -> bytes:
+        return b''.join(r.to_buffer() for r in self.records)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, FrozenNdefMessage):
+            return NotImplemented
+        return hash(self) == hash(other) and self.records == other.records
+
+    def __hash__(self) -> int:
+        h = self._hash
+        if h is None:
+            h = hash(self.records)
+            object.__setattr__(self, '_hash', h)
+        return h
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError('FrozenNdefMessage is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('FrozenNdefMessage is immutable')
+
+    def __reduce__(self) -> tuple[Callable[..., object], tuple[tuple[FrozenNdefRecord, ...]]]:
+        return FrozenNdefMessage._from_records, (self.records,)
+
+    def __repr__(self) -> str:
+        return 'FrozenNdefMessage(records=%r)' % (self.records,)
+
+
+def _with_begin_end(records: Iterable[FrozenNdefRecord]) -> list[FrozenNdefRecord]:
+    records = list(records)
+    last = len(records) - 1
+    for i, r in enumerate(records):
+        begin = i == 0
+        end = i == last
+        if r.flags.message_begin != begin or r.flags.message_end != end:
+            records[i] = r.evolve(flags=r.flags._replace(message_begin=begin, message_end=end))
+    return records
+
+
+def _read_record(reader: BufferReader) -> tuple[int, bytes, bytes, bytes]:
+    flags_raw = reader.read_8()
+    type_len = reader.read_8()
+
+    if flags_raw & FLAGS_SHORT:
+        payload_len = reader.read_8()
+    else:
+        payload_len = reader.read_32()
+
+    if flags_raw & FLAGS_ID:
+        id_len = reader.read_8()
+    else:
+        id_len = 0
+
+    type = reader.read(type_len)
+    id = reader.read(id_len)
+    payload = reader.read(payload_len)
+
+    return flags_raw, type, id, payload
+
+
+def _read_frozen_records(reader: BufferReader) -> list[FrozenNdefRecord]:
+    records = []
+    while not reader.eob():
+        flags_raw, type, id, payload = _read_record(reader)
+        records.append(FrozenNdefRecord(flags_raw & FLAGS_TNF_MASK, type, id, payload, _FROZEN_FLAGS[flags_raw]))
+    return records
+
+
+def _verify_record(record: NdefRecord | FrozenNdefRecord) -> None:
+    if record.tnf == TNF_EMPTY:
+        if record.type_len or record.id_len or record.payload_len:
+            raise InvalidNdefRecord("TNF is set to 'empty' but record not empty")
+
+    if record.tnf == TNF_UNKNOWN:
+        if record.type_len:
+            raise InvalidNdefRecord("TNF is set to 'unknown' but type not empty")
+
+    if record.tnf == TNF_UNCHANGED:
+        if record.type_len:
+            raise InvalidNdefRecord("TNF is set to 'unchanged' but type not empty")
+        if record.flags.id:
+            raise InvalidNdefRecord("TNF is set to 'unchanged' but id flag is on")
+
+    if record.tnf == TNF_RESERVED:
+        raise InvalidNdefRecord("TNF is set to 'reserved' (0x07)")
+
+    if record.tnf == TNF_WELL_KNOWN:
+        if record.type == RTD_TEXT:
+            if len(record.payload) == 0:
+                raise InvalidNdefRecord('RTD_TEXT payload missing status byte')
+
+            encoding = 'utf-8'
+            if record.payload[0] & 0x80:
+                encoding = 'utf-16'
+
+            language_len = record.payload[0] & 0x1f
+            if record.payload_len < 1 + language_len:
+                raise InvalidNdefRecord('RTD_TEXT contains invalid language code length')
+
+            try:
+                record.payload[1:1 + language_len].decode('us-ascii')
+            except UnicodeDecodeError:
+                raise InvalidNdefRecord('RTD_TEXT contains language code with invalid encoding')
+
+            try:
+                record.payload[language_len + 1:].decode(encoding)
+            except UnicodeDecodeError:
+                raise InvalidNdefRecord('RTD_TEXT payload failed to decode as ' + encoding)
+
+        elif record.type == RTD_URI:
+            if len(record.payload) == 0:
+                raise InvalidNdefRecord('RTD_URI payload missing status byte')
+
+            if record.payload[0] > RTD_URI_ABBRIV_NUM:
+                raise InvalidNdefRecord('RTD_URI payload starts with an invalid URI identifier code')
+
+            try:
+                record.payload[1:].decode('utf-8')
+            except UnicodeDecodeError:
+                raise InvalidNdefRecord('RTD_URI payload failed to decode as utf-8')
+
+        elif record.type == RTD_SMART_POSTER:
+            # parse internal message to verify it contains no errors
+            NdefMessage(record.payload)
+
+            # TODO verify all other well known types
+
+
+def _record_to_buffer(record: NdefRecord | FrozenNdefRecord) -> bytes:
+    w = BufferWriter()
+    w.write_8(_raw_flags(record) | record.tnf)
+    w.write_8(record.type_len)
+    if record.flags.short:
+        w.write_8(record.payload_len)
+    else:
+        w.write_32(record.payload_len)
+    if record.flags.id:
+        w.write_8(record.id_len)
+    w.write_bytes(record.type)
+    if record.flags.id:
+        w.write_bytes(record.id)
+    w.write_bytes(record.payload)
+    return w.get()
+
+
+def _raw_flags(record: NdefRecord | FrozenNdefRecord) -> int:
+    raw = 0
+    if record.flags.chunked:
+        raw |= FLAGS_CHUNKED
+    if record.flags.id:
+        raw |= FLAGS_ID
+    if record.flags.message_begin:
+        raw |= FLAGS_MB
+    if record.flags.message_end:
+        raw |= FLAGS_ME
+    if record.flags.short:
+        raw |= FLAGS_SHORT
+    return raw
+
+
+def _verify_message(records: Sequence[NdefRecord | FrozenNdefRecord]) -> None:
+    _verify_records(records)
+    _verify_begin_end(records)
+    _verify_chunks(records)
+    _verify_android_specific(records)
+
+
+def _verify_records(records: Sequence[NdefRecord | FrozenNdefRecord]) -> None:
+    for r in records:
+        r.verify()
+
+
+def _verify_begin_end(records: Sequence[NdefRecord | FrozenNdefRecord]) -> None:
+    if not records[0].flags.message_begin:
+        raise InvalidNdefMessage("first record's MB flag is off")
+    for r in records[1:]:
+        if r.flags.message_begin:
+            raise InvalidNdefMessage("MB flag is on for non-first record")
+    if not records[-1].flags.message_end:
+        raise InvalidNdefMessage("last record's ME flag is off")
+    for r in records[:-1]:
+        if r.flags.message_end:
+            raise InvalidNdefMessage("ME flag is on for non-last record")
+
+
+def _verify_chunks(records: Sequence[NdefRecord | FrozenNdefRecord]) -> None:
+    chunked = False
+    for r in records:
+        if chunked:
+            if r.tnf != TNF_UNCHANGED:
+                raise InvalidNdefMessage("record chunk type is not 'unchanged'")
+        elif r.tnf == TNF_UNCHANGED:
+            raise InvalidNdefMessage("non-chunked record type is 'unchanged'")
+
+        chunked = r.flags.chunked
+
+    if records[-1].flags.chunked:
+        raise InvalidNdefMessage("last record still chunked")
+
+
+def _verify_android_specific(records: Sequence[NdefRecord | FrozenNdefRecord]) -> None:
+    if records[0].tnf != TNF_UNKNOWN and records[0].tnf != TNF_EMPTY:
+        if not records[0].type_len:
+            raise InvalidNdefMessage("first record has no type, but is also not empty or unknown")
 
 
 def new_message(*record_defs: Sequence) -> NdefMessage:
@@ -354,6 +648,69 @@ def new_message(*record_defs: Sequence) -> NdefMessage:
     return message
 
 
+def encode_many(tnf: Sequence[int], type: Sequence[bytes], id: Sequence[bytes], payload: Sequence[bytes],
+                message_boundaries: Sequence[int], verify: bool = True) -> tuple[bytearray, array.array[int]]:
+    # encodes many messages into one buffer. record i of the columns belongs to message m when
+    # message_boundaries[m] <= i < message_boundaries[m + 1]. message m is buffer[offsets[m]:offsets[m + 1]].
+    count = len(tnf)
+    if len(type) != count or len(id) != count or len(payload) != count:
+        raise InvalidNdefRecord('invalid record columns - different lengths [tnf=%d, type=%d, id=%d, payload=%d]' % (
+            count, len(type), len(id), len(payload)))
+    if len(message_boundaries) == 0 or message_boundaries[0] != 0 or message_boundaries[-1] != count:
+        raise InvalidNdefMessage('message boundaries must start at 0 and end at %d' % count)
+
+    type_lens = [len(t) for t in type]
+    id_lens = [len(i) for i in id]
+    payload_lens = [len(p) for p in payload]
+    if max(type_lens, default=0) > 0xff or max(id_lens, default=0) > 0xff or \
+            max(payload_lens, default=0) > 0xffffffff:
+        raise InvalidNdef('bad number')
+    if any(t < 0 or t > FLAGS_TNF_MASK for t in tnf):
+        raise InvalidNdefRecord('invalid TNF - must be between 0 and %d' % FLAGS_TNF_MASK)
+
+    flags = [(FLAGS_SHORT if p < 256 else 0) | (FLAGS_ID if i else 0) for p, i in zip(payload_lens, id_lens)]
+    sizes = [(3 if p < 256 else 6) + (1 + i if i else 0) + t + p for t, i, p in zip(type_lens, id_lens, payload_lens)]
+
+    for start, end in zip(message_boundaries, message_boundaries[1:]):
+        if start > end:
+            raise InvalidNdefMessage('message boundaries must increase [%d after %d]' % (end, start))
+        if start == end:
+            raise InvalidNdef("empty NDEF message")
+        flags[start] |= FLAGS_MB
+        flags[end - 1] |= FLAGS_ME
+
+    if verify:
+        for start, end in zip(message_boundaries, message_boundaries[1:]):
+            _verify_message([FrozenNdefRecord(tnf[i], type[i], id[i], payload[i], _FROZEN_FLAGS[flags[i]])
+                             for i in range(start, end)])
+
+    record_offsets = list(itertools.accumulate(sizes, initial=0))
+    offsets = array.array('Q', [record_offsets[b] for b in message_boundaries])
+    buffer = bytearray(record_offsets[-1])
+    pack_32 = SIZE2PACKER[32].pack_into
+
+    for i in range(count):
+        o = record_offsets[i]
+        buffer[o] = flags[i] | tnf[i]
+        buffer[o + 1] = type_lens[i]
+        if flags[i] & FLAGS_SHORT:
+            buffer[o + 2] = payload_lens[i]
+            o += 3
+        else:
+            pack_32(buffer, o + 2, payload_lens[i])
+            o += 6
+        if id_lens[i]:
+            buffer[o] = id_lens[i]
+            o += 1
+        buffer[o:o + type_lens[i]] = type[i]
+        o += type_lens[i]
+        buffer[o:o + id_lens[i]] = id[i]
+        o += id_lens[i]
+        buffer[o:o + payload_lens[i]] = payload[i]
+
+    return buffer, offsets
+
+
 def _url_ndef_abbrv(url: str) -> bytes:
     abbrv_table = """http://www.
     https://www.
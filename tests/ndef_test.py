@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import pickle
 import sys
+import threading
 import unittest
+from typing import Sequence
 
 import six
 
 from ndef.ndef import BufferReader, InvalidNdef, NdefMessage, InvalidNdefMessage, InvalidNdefRecord, new_message, \
-    TNF_EMPTY, TNF_WELL_KNOWN, RTD_TEXT, BufferWriter, new_smart_poster, _url_ndef_abbrv, NdefRecord, RTD_URI
+    TNF_EMPTY, TNF_WELL_KNOWN, RTD_TEXT, BufferWriter, new_smart_poster, _url_ndef_abbrv, NdefRecord, RTD_URI, \
+    FrozenNdefMessage, FrozenNdefRecord, FrozenNdefRecordFlags, NdefParser, encode_many
 
 
 # TODO chunked
@@ -220,3 +224,225 @@ class TestNdefClass(unittest.TestCase):
         ndefrecord.type = b''
 
         ndefrecord.to_buffer()
+
+
+class TestEncodeMany(unittest.TestCase):
+    MESSAGES: list[list[tuple[int, bytes, bytes, bytes]]] = [
+        [(TNF_EMPTY, b'', b'', b'')],
+        [(TNF_EMPTY, b'', b'', b''), (TNF_EMPTY, b'', b'', b'')],
+        [(TNF_WELL_KNOWN, RTD_TEXT, b'hello', b'\x02enworld')],
+        [(TNF_WELL_KNOWN, RTD_TEXT, b'', b'\x02en' + b'x' * 300), (TNF_WELL_KNOWN, RTD_URI, b'id', b'\x03test.com')],
+    ]
+
+    def _encode(self, messages: list[list[tuple[int, bytes, bytes, bytes]]],
+                verify: bool = True) -> tuple[bytearray, Sequence[int]]:
+        records = [r for m in messages for r in m]
+        boundaries = [0]
+        for m in messages:
+            boundaries.append(boundaries[-1] + len(m))
+        return encode_many([r[0] for r in records], [r[1] for r in records], [r[2] for r in records],
+                           [r[3] for r in records], boundaries, verify=verify)
+
+    def test_matches_new_message(self) -> None:
+        buffer, offsets = self._encode(self.MESSAGES)
+
+        self.assertEqual(len(offsets), len(self.MESSAGES) + 1)
+        self.assertEqual(offsets[-1], len(buffer))
+        for i, records in enumerate(self.MESSAGES):
+            self.assertEqual(bytes(buffer[offsets[i]:offsets[i + 1]]), new_message(*records).to_buffer())
+
+    def test_no_messages(self) -> None:
+        buffer, offsets = encode_many([], [], [], [], [0])
+        self.assertEqual(buffer, bytearray())
+        self.assertEqual(list(offsets), [0])
+
+    def test_verify(self) -> None:
+        invalid = [[(TNF_EMPTY, b'a', b'', b'')]]
+        with self.assertRaises(InvalidNdefRecord):
+            self._encode(self.MESSAGES + invalid)
+
+        buffer, offsets = self._encode(invalid, verify=False)
+        self.assertEqual(bytes(buffer), decode_hex('d0010061'))
+        with self.assertRaises(InvalidNdefRecord):
+            NdefMessage(bytes(buffer))
+
+    def test_invalid_inputs(self) -> None:
+        with self.assertRaises(InvalidNdefRecord):
+            encode_many([TNF_EMPTY], [b''], [b''], [], [0, 1])
+        with self.assertRaises(InvalidNdefMessage):
+            encode_many([TNF_EMPTY], [b''], [b''], [b''], [0])
+        with self.assertRaises(InvalidNdef):
+            encode_many([TNF_EMPTY, TNF_EMPTY], [b'', b''], [b'', b''], [b'', b''], [0, 0, 2])
+        with self.assertRaises(InvalidNdef):
+            encode_many([TNF_WELL_KNOWN], [b'x' * 256], [b''], [b''], [0, 1], verify=False)
+        with self.assertRaises(InvalidNdefMessage):
+            encode_many([TNF_EMPTY] * 3, [b''] * 3, [b''] * 3, [b''] * 3, [0, 2, 1, 3])
+        for tnf in [-1, 8, 1000]:
+            with self.assertRaises(InvalidNdefRecord):
+                encode_many([tnf], [b'x'], [b''], [b''], [0, 1], verify=False)
+
+
+class TestNdefParser(unittest.TestCase):
+    def test_reset(self) -> None:
+        parser = NdefParser()
+        for data in ['D1010F5402656E48656C6C6F20776F726C6421', '99010501556101234567614901050000000155610123456761',
+                     'b9010101556100360001ff560001ff', 'd00000']:
+            raw = decode_hex(data)
+            parser.reset(raw)
+            self.assertEqual(len(parser.records), len(NdefMessage(raw).records))
+            self.assertEqual(b''.join(r.to_buffer() for r in parser.records), raw)
+
+    def test_reuses_records(self) -> None:
+        parser = NdefParser(decode_hex('b9010101556100360001ff560001ff'))
+        first = list(parser.records)
+
+        parser.reset(decode_hex('d1010F5402656E48656C6C6F20776F726C6421'))
+        self.assertIs(parser.records[0], first[0])
+        self.assertTrue(parser.records[0].flags.message_end)
+        self.assertFalse(parser.records[0].flags.chunked)
+        self.assertFalse(parser.records[0].flags.id)
+        self.assertEqual(parser.records[0].type, RTD_TEXT)
+
+    def test_detach(self) -> None:
+        parser = NdefParser(decode_hex('d1010F5402656E48656C6C6F20776F726C6421'))
+        message = parser.detach()
+        self.assertEqual(parser.records, [])
+
+        parser.reset(decode_hex('d00000'))
+        self.assertIsNot(parser.records[0], message.records[0])
+        self.assertEqual(message.to_buffer(), decode_hex('d1010F5402656E48656C6C6F20776F726C6421'))
+
+    def test_invalid(self) -> None:
+        parser = NdefParser()
+        for data in ['', 'd90105015561', '9901050155610123456761', 'd00001ff']:
+            with self.assertRaises(InvalidNdef):
+                parser.reset(decode_hex(data))
+            self.assertEqual(parser.records, [])
+
+        parser.reset(decode_hex('d00000'))
+        self.assertEqual(len(parser.records), 1)
+
+
+class TestFrozenNdef(unittest.TestCase):
+    TEXT = 'D1010F5402656E48656C6C6F20776F726C6421'
+    SMART_POSTER = ('d1023353709101195500687474703a2f2f7777772e66616365626f6' +
+                    'f6b2e636f6d2f1103016163740051010b5402656e46616365626f6f6b')
+
+    def test_parse(self) -> None:
+        for data in [self.TEXT, self.SMART_POSTER, 'c901050000000155610123456761', 'b9010101556100360001ff560001ff']:
+            raw = decode_hex(data)
+            frozen = FrozenNdefMessage(raw)
+            self.assertEqual(frozen.to_buffer(), raw)
+            self.assertEqual(frozen.to_buffer(), NdefMessage(raw).to_buffer())
+            self.assertEqual(frozen, FrozenNdefMessage.from_message(NdefMessage(raw)))
+            self.assertEqual(frozen.thaw().to_buffer(), raw)
+
+    def test_parse_invalid(self) -> None:
+        for data in ['', 'd90105015561', '9901050155610123456761', 'd00001ff', 'd1010255ff00']:
+            with self.assertRaises(InvalidNdef):
+                FrozenNdefMessage(decode_hex(data))
+
+    def test_immutable(self) -> None:
+        message = FrozenNdefMessage(decode_hex(self.TEXT))
+        record = message.records[0]
+
+        with self.assertRaises(AttributeError):
+            record.payload = b''  # type: ignore
+        with self.assertRaises(AttributeError):
+            del record.type
+        with self.assertRaises(AttributeError):
+            record.flags.id = True  # type: ignore
+        with self.assertRaises(AttributeError):
+            message.records = ()  # type: ignore
+
+    def test_hash_and_equality(self) -> None:
+        a = FrozenNdefMessage(decode_hex(self.TEXT))
+        b = FrozenNdefMessage(decode_hex(self.TEXT))
+        c = FrozenNdefMessage(decode_hex(self.SMART_POSTER))
+
+        self.assertIsNot(a, b)
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertNotEqual(a, c)
+        self.assertEqual(len({a, b, c}), 2)
+        self.assertEqual(a.records[0], b.records[0])
+        self.assertNotEqual(a.records[0], a.records[0].evolve(payload=b'\x02enbye'))
+
+    def test_evolve_record(self) -> None:
+        record = FrozenNdefRecord(TNF_WELL_KNOWN, RTD_TEXT, b'', b'\x02enhello')
+        self.assertFalse(record.flags.id)
+        self.assertTrue(record.flags.short)
+
+        evolved = record.evolve(id=b'id', payload=b'\x02en' + b'x' * 300)
+        self.assertTrue(evolved.flags.id)
+        self.assertFalse(evolved.flags.short)
+        self.assertEqual(evolved.type, RTD_TEXT)
+        self.assertEqual(record.payload, b'\x02enhello')
+
+    def test_evolve_message(self) -> None:
+        message = FrozenNdefMessage(records=(FrozenNdefRecord(TNF_EMPTY) for _ in range(3)))
+        message.verify()
+        self.assertEqual(message.to_buffer(), decode_hex('900000100000500000'))
+
+        text = FrozenNdefRecord(TNF_WELL_KNOWN, RTD_TEXT, b'', b'\x02enhello')
+        evolved = message.evolve(message.records[:2] + (text,))
+        evolved.verify()
+        self.assertIs(evolved.records[0], message.records[0])
+        self.assertIs(evolved.records[1], message.records[1])
+        self.assertTrue(evolved.records[2].flags.message_end)
+
+        appended = evolved.evolve(evolved.records + (FrozenNdefRecord(TNF_EMPTY),))
+        appended.verify()
+        self.assertIs(appended.records[1], evolved.records[1])
+        self.assertFalse(appended.records[2].flags.message_end)
+
+    def test_constructor(self) -> None:
+        with self.assertRaises(TypeError):
+            FrozenNdefMessage(decode_hex(self.TEXT), records=[FrozenNdefRecord(TNF_EMPTY)])
+
+        record = FrozenNdefRecord(TNF_WELL_KNOWN, RTD_TEXT, b'', b'\x02enhello', FrozenNdefRecordFlags(True, True, short=True))
+        message = FrozenNdefMessage(records=[record])
+        self.assertIs(message.records[0], record)
+
+        message = FrozenNdefMessage(records=[FrozenNdefRecord(TNF_EMPTY), record])
+        message.verify()
+        self.assertEqual(message.to_buffer(), decode_hex('900000510108') + b'T\x02enhello')
+
+    def test_from_message_keeps_flags(self) -> None:
+        mutable = NdefMessage()
+        mutable.records = [NdefRecord()]
+        frozen = FrozenNdefMessage.from_message(mutable)
+        self.assertFalse(frozen.records[0].flags.message_begin)
+        with self.assertRaises(InvalidNdefMessage):
+            frozen.verify()
+        self.assertEqual(pickle.loads(pickle.dumps(frozen)), frozen)
+
+    def test_pickle(self) -> None:
+        message = FrozenNdefMessage(decode_hex(self.SMART_POSTER))
+        self.assertEqual(pickle.loads(pickle.dumps(message)), message)
+
+    def test_threads(self) -> None:
+        message = FrozenNdefMessage(decode_hex(self.SMART_POSTER))
+        expected = message.to_buffer()
+        results: dict[FrozenNdefMessage, int] = {}
+        errors = []
+        lock = threading.Lock()
+
+        def worker() -> None:
+            try:
+                for _ in range(200):
+                    message.verify()
+                    assert message.to_buffer() == expected
+                    with lock:
+                        results[message] = results.get(message, 0) + 1
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(results, {FrozenNdefMessage(expected): 1600})